@@ -1,3 +1,12 @@
 """Evidence API – motor de prova de coerência (M-CSQI)."""
 
-from .coherence_engine import CoherenceEngine, LAMBDA_SOVEREIGN, PSI_ETHICAL_THRESHOLD  # noqa: F401
+from .coherence_engine import (  # noqa: F401
+    LAMBDA_SOVEREIGN,
+    PSI_ETHICAL_THRESHOLD,
+    CoherenceEngine,
+    calculate_psi_batch,
+    calculate_psi_index,
+    get_coherence_status,
+    relative_entropy,
+    uhlmann_fidelity,
+)
@@ -0,0 +1,69 @@
+# cython: language_level=3
+"""Kernel Cython (opcional) para o cálculo de Ψ.
+
+Especializado para a dimensão do seed de ρ_ext (5): as reduções
+``<a, a>``, ``<b, b>`` e ``<a, b>`` são desenroladas à mão. Outras dimensões
+usam o laço genérico. Recebe float64: a entrada bruta dispensa ``normalize``,
+já que as normas saem da mesma passada. Compilar com::
+
+    python setup.py build_ext --inplace
+"""
+
+cimport cython
+from libc.math cimport expm1, sqrt
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def psi(const double[::1] a, const double[::1] b, double lam):
+    cdef Py_ssize_t n = a.shape[0]
+    cdef Py_ssize_t i
+    cdef double aa = 0.0, bb = 0.0, ab = 0.0, sa = 0.0, sb = 0.0
+    cdef double x, y
+    cdef double a0, a1, a2, a3, a4, b0, b1, b2, b3, b4
+
+    if b.shape[0] != n:
+        raise ValueError("Os vetores ρ_int e ρ_ext precisam ter a mesma dimensão.")
+    if n == 0:
+        raise ValueError("Os vetores ρ_int e ρ_ext não podem ser vazios.")
+
+    if n == 5:
+        a0 = a[0]; a1 = a[1]; a2 = a[2]; a3 = a[3]; a4 = a[4]
+        b0 = b[0]; b1 = b[1]; b2 = b[2]; b3 = b[3]; b4 = b[4]
+        aa = a0 * a0 + a1 * a1 + a2 * a2 + a3 * a3 + a4 * a4
+        bb = b0 * b0 + b1 * b1 + b2 * b2 + b3 * b3 + b4 * b4
+        ab = a0 * b0 + a1 * b1 + a2 * b2 + a3 * b3 + a4 * b4
+        sa = a0 + a1 + a2 + a3 + a4
+        sb = b0 + b1 + b2 + b3 + b4
+    else:
+        for i in range(n):
+            x = a[i]
+            y = b[i]
+            aa += x * x
+            bb += y * y
+            ab += x * y
+            sa += x
+            sb += y
+
+    # Vetor nulo: mesma convenção de ``coherence_engine.normalize``
+    # (vira o vetor uniforme 1/sqrt(n)).
+    if aa == 0.0 and bb == 0.0:
+        aa = 1.0
+        bb = 1.0
+        ab = 1.0
+    elif aa == 0.0:
+        aa = 1.0
+        ab = sb / sqrt(<double>n)
+    elif bb == 0.0:
+        bb = 1.0
+        ab = sa / sqrt(<double>n)
+
+    cdef double cos = ab / sqrt(aa * bb)
+    cdef double distance = sqrt(max(0.0, 2.0 - 2.0 * cos))
+
+    cdef double fidelity = min(max(cos, 0.0), 1.0)
+    cdef double penalty = -expm1(-0.5 * distance)
+
+    cdef double result = fidelity - lam * penalty
+    return result if result > 0.0 else 0.0
@@ -8,13 +8,31 @@ onde:
     S  ~ penalidade entrópica       → usamos distância euclidiana normalizada.
     λ  = 0.27 (Constante Civilizacional, fixa).
 
-Este módulo **não depende** de FastAPI: é puro Python + NumPy.
+Este módulo **não depende** de FastAPI: é puro Python + NumPy. O caminho
+padrão de ``calculate_psi_index`` usa, nesta ordem, a extensão Cython
+``_psi_kernel`` (se compilada), o kernel Numba de ``coherence_numba`` (se o
+Numba estiver instalado) ou a passada NumPy. Se o SimSIMD estiver instalado,
+o cosseno de ``uhlmann_fidelity`` e ``relative_entropy`` (que normalizam as
+entradas) usa seus kernels SIMD; com vetores unitários basta o produto
+interno.
 """
 
 from __future__ import annotations
 
+import math
 import numpy as np
 
+try:  # extensão Cython opcional (``python setup.py build_ext --inplace``)
+    from ._psi_kernel import psi as _compiled_psi
+except ImportError:  # pragma: no cover - depende do build
+    # Só importa (e aquece) o Numba quando a extensão Cython não existe
+    from .coherence_numba import psi_kernel as _compiled_psi
+
+try:  # dependência opcional
+    import simsimd
+except ImportError:  # pragma: no cover - depende do ambiente
+    simsimd = None
+
 # Constante Civilizacional (Multiplicador de Landau-Entropia)
 LAMBDA_SOVEREIGN: float = 0.27
 
@@ -22,6 +40,242 @@ LAMBDA_SOVEREIGN: float = 0.27
 PSI_ETHICAL_THRESHOLD: float = 0.85
 
 
+def _numpy_cos(a: np.ndarray, b: np.ndarray) -> float:
+    denom = math.sqrt(float(np.vdot(a, a)) * float(np.vdot(b, b)))
+    if denom == 0.0:
+        return 0.0
+    return float(np.vdot(a, b)) / denom
+
+
+def _simsimd_cos(a: np.ndarray, b: np.ndarray) -> float:
+    # SimSIMD exige buffers contíguos e do mesmo dtype (sem cópia se já forem)
+    a = np.ascontiguousarray(a, dtype=np.float32)
+    b = np.ascontiguousarray(b, dtype=np.float32)
+    # ``simsimd.cosine`` devolve a distância de cosseno (1 - cos)
+    return 1.0 - float(simsimd.cosine(a, b))
+
+
+def _penalty_from_cos(cos: float) -> float:
+    # Para vetores unitários, distance = sqrt(2 - 2 · cos); distance >= 0
+    # garante S ∈ [0, 1) sem clip
+    distance = math.sqrt(max(0.0, 2.0 - 2.0 * cos))
+    return -math.expm1(-0.5 * distance)
+
+
+_cos_impl = _simsimd_cos if simsimd is not None else _numpy_cos
+
+
+def _raw_cos(a: np.ndarray, b: np.ndarray) -> float:
+    """Cosseno em float64 sem normalizar antes, como nos kernels compilados.
+
+    Segue a convenção de ``normalize``: vetor nulo vale como o vetor uniforme.
+    """
+    aa = float(np.vdot(a, a))
+    bb = float(np.vdot(b, b))
+    if aa == 0.0 and bb == 0.0:
+        return 1.0
+    if aa == 0.0:
+        return float(b.sum()) / math.sqrt(a.size * bb)
+    if bb == 0.0:
+        return float(a.sum()) / math.sqrt(b.size * aa)
+    return float(np.vdot(a, b)) / math.sqrt(aa * bb)
+
+
+def _quantize_int8(vec: np.ndarray) -> np.ndarray:
+    """Quantiza componentes em [-1, 1] (vetores unitários) para int8."""
+    return np.round(vec * 127).astype(np.int8)
+
+
+def _numpy_cos_int8(q_matrix: np.ndarray, q_vector: np.ndarray) -> np.ndarray:
+    m = q_matrix.astype(np.int32)
+    v = q_vector.astype(np.int32)
+    denom = np.sqrt(np.einsum("ij,ij->i", m, m) * float(v @ v))
+    dots = (m @ v).astype(np.float32)
+    return np.divide(dots, denom, out=np.zeros_like(dots), where=denom != 0)
+
+
+def _simsimd_cos_int8(q_matrix: np.ndarray, q_vector: np.ndarray) -> np.ndarray:
+    distances = np.asarray(simsimd.cdist(q_matrix, q_vector[None, :], metric="cosine"))
+    return 1.0 - distances[:, 0]
+
+
+_cos_int8_impl = _simsimd_cos_int8 if simsimd is not None else _numpy_cos_int8
+
+
+def normalize(vec: np.ndarray) -> np.ndarray:
+    """Normaliza ``vec`` (1-D) ou cada linha de ``vec`` (N×D) pela norma L2.
+
+    A norma é acumulada em float64 (vetores muito pequenos ou muito grandes não
+    sofrem underflow/overflow em float32); o vetor unitário sai em float32.
+    """
+    vec = np.asarray(vec, dtype=np.float64)
+    if vec.ndim <= 1:
+        norm = math.sqrt(float(np.dot(vec, vec)))
+        if norm == 0.0:
+            # Evita divisão por zero: vetor nulo vira vetor uniforme
+            size = int(vec.size or 1)
+            return np.full(size, 1.0 / math.sqrt(size), dtype=np.float32)
+        return (vec / norm).astype(np.float32)
+
+    if vec.shape[-1] == 0:
+        # Linhas vazias: nada a normalizar (nem vetor uniforme a construir)
+        return np.ascontiguousarray(vec, dtype=np.float32)
+
+    norms = np.sqrt(np.einsum("...i,...i->...", vec, vec))
+    zero = norms == 0.0
+    out = (vec / np.where(zero, 1.0, norms)[..., None]).astype(np.float32)
+    # Linhas nulas viram o vetor uniforme, como no caso 1-D
+    out[zero] = 1.0 / math.sqrt(vec.shape[-1])
+    return out
+
+
+def uhlmann_fidelity(rho_int: np.ndarray, rho_ext: np.ndarray) -> float:
+    """Aproximação prática da Fidelidade de Uhlmann.
+
+    Formalmente:
+        F(ρ1, ρ2) = (Tr[sqrt(sqrt(ρ1) ρ2 sqrt(ρ1))])²
+
+    Aqui usamos similaridade de cosseno entre vetores normalizados como
+    aproximação computacional simples e estável.
+    """
+    rho_int_n = normalize(rho_int)
+    rho_ext_n = normalize(rho_ext)
+
+    dot = _cos_impl(rho_int_n, rho_ext_n)
+    # Clip para [0, 1] garantindo interpretação probabilística
+    return min(max(dot, 0.0), 1.0)
+
+
+def relative_entropy(rho_int: np.ndarray, rho_ext: np.ndarray) -> float:
+    """Penalidade entrópica S(ρ_int || ρ_ext).
+
+    Em vez da fórmula exata de entropia relativa, usamos uma métrica
+    geométrica controlada:
+
+        distance = ||ρ_int - ρ_ext||_2
+        penalty  = 1 - exp(-0.5 · distance)
+
+    Isso mantém S ∈ [0, 1) e cresce com a incoerência. Para vetores
+    unitários, distance = sqrt(2 - 2 · cos).
+    """
+    rho_int_n = normalize(rho_int)
+    rho_ext_n = normalize(rho_ext)
+
+    return _penalty_from_cos(_cos_impl(rho_int_n, rho_ext_n))
+
+
+def uhlmann_fidelity_unit(rho_int_unit: np.ndarray, rho_ext_unit: np.ndarray) -> float:
+    """Fidelidade para vetores já L2-normalizados.
+
+    Com ||ρ_int|| = ||ρ_ext|| = 1, o cosseno colapsa no produto interno.
+    """
+    dot = float(np.dot(rho_int_unit, rho_ext_unit))
+    return min(max(dot, 0.0), 1.0)
+
+
+def relative_entropy_unit(rho_int_unit: np.ndarray, rho_ext_unit: np.ndarray) -> float:
+    """Penalidade entrópica para vetores já L2-normalizados."""
+    return _penalty_from_cos(float(np.dot(rho_int_unit, rho_ext_unit)))
+
+
+def calculate_psi_index(
+    intent_vector: np.ndarray,
+    external_vector: np.ndarray,
+    lambda_sovereign: float = LAMBDA_SOVEREIGN,
+    assume_normalized: bool = False,
+) -> float:
+    """Calcula o Ψ-Index conforme M-CSQI.
+
+    Ψ = F(ρ_int, ρ_ext) - λ · S(ρ_int || ρ_ext)
+
+    Por padrão os vetores entram brutos, em float64, e as normas saem da
+    mesma passada do produto interno (sem ``normalize``). Com
+    ``assume_normalized=True`` o chamador garante que ambos já têm norma 1
+    (caso do ``/evidence``) e o produto interno já é o cosseno. Em ambos os
+    casos Ψ sai do kernel compilado (Cython ou Numba), se disponível.
+    """
+    intent_arr = np.asarray(intent_vector)
+    external_arr = np.asarray(external_vector)
+
+    if intent_arr.size == 0 or external_arr.size == 0:
+        raise ValueError("Os vetores ρ_int e ρ_ext não podem ser vazios.")
+    if intent_arr.shape != external_arr.shape:
+        raise ValueError(
+            "Os vetores ρ_int e ρ_ext precisam ter a mesma dimensão "
+            f"(recebido {intent_arr.shape} vs {external_arr.shape})."
+        )
+
+    # Kernels compilados recebem float64 contíguo (sem cópia se já for)
+    intent_arr = np.ascontiguousarray(intent_arr, dtype=np.float64)
+    external_arr = np.ascontiguousarray(external_arr, dtype=np.float64)
+
+    if _compiled_psi is not None and intent_arr.ndim == 1:
+        return float(_compiled_psi(intent_arr, external_arr, float(lambda_sovereign)))
+
+    # Um único cosseno alimenta F e S
+    if assume_normalized:
+        cos = float(np.vdot(intent_arr, external_arr))
+    else:
+        cos = _raw_cos(intent_arr, external_arr)
+    fidelity = min(max(cos, 0.0), 1.0)
+    entropy_penalty = _penalty_from_cos(cos)
+
+    # F ≤ 1 e λ · S ≥ 0: só o limite inferior de Ψ precisa de clip
+    psi = fidelity - (lambda_sovereign * entropy_penalty)
+    return psi if psi > 0.0 else 0.0
+
+
+def calculate_psi_batch(
+    intent_matrix: np.ndarray,
+    external_vector: np.ndarray,
+    lambda_sovereign: float = LAMBDA_SOVEREIGN,
+    quantized: bool = False,
+) -> np.ndarray:
+    """Calcula Ψ para várias intenções (uma por linha) contra o mesmo ρ_ext.
+
+    As linhas de ``intent_matrix`` são normalizadas em bloco e as
+    fidelidades saem de um único produto matriz-vetor (BLAS ``gemv``),
+    amortizando o custo de chamada entre todas as intenções.
+
+    Com ``quantized=True`` os vetores unitários são quantizados para int8
+    antes do cosseno: troca precisão (~1e-2 em Ψ) por armazenamento int8.
+    """
+    matrix = np.atleast_2d(np.asarray(intent_matrix, dtype=np.float64))
+    external_arr = normalize(external_vector)
+
+    if matrix.size == 0 or external_arr.size == 0:
+        raise ValueError("Os vetores ρ_int e ρ_ext não podem ser vazios.")
+    if matrix.ndim != 2 or matrix.shape[1] != external_arr.shape[0]:
+        raise ValueError(
+            "Os vetores ρ_int e ρ_ext precisam ter a mesma dimensão "
+            f"(recebido {matrix.shape} vs {external_arr.shape})."
+        )
+
+    matrix = normalize(matrix)
+
+    if quantized:
+        cos = _cos_int8_impl(_quantize_int8(matrix), _quantize_int8(external_arr))
+        fidelity = np.clip(cos, 0.0, 1.0)
+        distance = np.sqrt(np.maximum(0.0, 2.0 - 2.0 * cos))
+    else:
+        fidelity = np.clip(matrix @ external_arr, 0.0, 1.0)
+        diff = matrix - external_arr
+        distance = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+    penalty = -np.expm1(-0.5 * distance)
+
+    return np.maximum(fidelity - lambda_sovereign * penalty, 0.0)
+
+
+def get_coherence_status(
+    psi_index: float,
+    threshold: float = PSI_ETHICAL_THRESHOLD,
+) -> str:
+    """Retorna o status qualitativo do Ω-GATE para um dado Ψ."""
+    if psi_index >= threshold:
+        return "COERENTE (Ω-GATE: Aprovado)"
+    return "INCOERENTE (Ω-GATE: Penalidade Ativada)"
+
+
 class CoherenceEngine:
     """Motor de Coerência Semântica Quântica Invariante (M-CSQI).
 
@@ -30,97 +284,24 @@ class CoherenceEngine:
     - calcula F (coerência) via similaridade de cosseno;
     - calcula S (penalidade entrópica) via distância euclidiana normalizada;
     - combina tudo em um Ψ ∈ [0, 1].
+
+    Fachada de compatibilidade: os métodos são as funções de módulo acima
+    (``calculate_psi_index`` etc.), expostas como ``staticmethod``. No caminho
+    quente, prefira chamar as funções diretamente.
     """
 
-    @staticmethod
-    def _normalize(vec: np.ndarray) -> np.ndarray:
-        vec = np.asarray(vec, dtype=float)
-        norm = float(np.linalg.norm(vec))
-        if norm == 0.0:
-            # Evita divisão por zero: vetor nulo vira vetor uniforme
-            size = int(vec.size or 1)
-            return np.ones(size, dtype=float) / np.sqrt(size)
-        return vec / norm
-
-    @staticmethod
-    def uhlmann_fidelity(rho_int: np.ndarray, rho_ext: np.ndarray) -> float:
-        """Aproximação prática da Fidelidade de Uhlmann.
-
-        Formalmente:
-            F(ρ1, ρ2) = (Tr[sqrt(sqrt(ρ1) ρ2 sqrt(ρ1))])²
-
-        Aqui usamos similaridade de cosseno entre vetores normalizados como
-        aproximação computacional simples e estável.
-        """
-        rho_int_n = CoherenceEngine._normalize(rho_int)
-        rho_ext_n = CoherenceEngine._normalize(rho_ext)
-
-        dot = float(np.dot(rho_int_n, rho_ext_n))
-        # Clip para [0, 1] garantindo interpretação probabilística
-        return float(np.clip(dot, 0.0, 1.0))
-
-    @staticmethod
-    def relative_entropy(rho_int: np.ndarray, rho_ext: np.ndarray) -> float:
-        """Penalidade entrópica S(ρ_int || ρ_ext).
-
-        Em vez da fórmula exata de entropia relativa, usamos uma métrica
-        geométrica controlada:
-
-            distance = ||ρ_int - ρ_ext||_2
-            penalty  = 1 - exp(-0.5 · distance)
-
-        Isso mantém S ∈ [0, 1) e cresce com a incoerência.
-        """
-        rho_int_n = CoherenceEngine._normalize(rho_int)
-        rho_ext_n = CoherenceEngine._normalize(rho_ext)
-
-        distance = float(np.linalg.norm(rho_int_n - rho_ext_n))
-        penalty = 1.0 - float(np.exp(-0.5 * distance))
-        # Garantia numérica
-        return float(np.clip(penalty, 0.0, 1.0))
-
-    @classmethod
-    def calculate_psi_index(
-        cls,
-        intent_vector: np.ndarray,
-        external_vector: np.ndarray,
-        lambda_sovereign: float = LAMBDA_SOVEREIGN,
-    ) -> float:
-        """Calcula o Ψ-Index conforme M-CSQI.
-
-        Ψ = F(ρ_int, ρ_ext) - λ · S(ρ_int || ρ_ext)
-        """
-        intent_arr = np.asarray(intent_vector, dtype=float)
-        external_arr = np.asarray(external_vector, dtype=float)
-
-        if intent_arr.size == 0 or external_arr.size == 0:
-            raise ValueError("Os vetores ρ_int e ρ_ext não podem ser vazios.")
-        if intent_arr.shape != external_arr.shape:
-            raise ValueError(
-                "Os vetores ρ_int e ρ_ext precisam ter a mesma dimensão "
-                f"(recebido {intent_arr.shape} vs {external_arr.shape})."
-            )
-
-        fidelity = cls.uhlmann_fidelity(intent_arr, external_arr)
-        entropy_penalty = cls.relative_entropy(intent_arr, external_arr)
-
-        psi = fidelity - (lambda_sovereign * entropy_penalty)
-        return float(np.clip(psi, 0.0, 1.0))
-
-    @classmethod
-    def get_coherence_status(
-        cls,
-        psi_index: float,
-        threshold: float = PSI_ETHICAL_THRESHOLD,
-    ) -> str:
-        """Retorna o status qualitativo do Ω-GATE para um dado Ψ."""
-        if psi_index >= threshold:
-            return "COERENTE (Ω-GATE: Aprovado)"
-        return "INCOERENTE (Ω-GATE: Penalidade Ativada)"
+    _normalize = staticmethod(normalize)
+    uhlmann_fidelity = staticmethod(uhlmann_fidelity)
+    relative_entropy = staticmethod(relative_entropy)
+    uhlmann_fidelity_unit = staticmethod(uhlmann_fidelity_unit)
+    relative_entropy_unit = staticmethod(relative_entropy_unit)
+    calculate_psi_index = staticmethod(calculate_psi_index)
+    calculate_psi_batch = staticmethod(calculate_psi_batch)
+    get_coherence_status = staticmethod(get_coherence_status)
 
 
 if __name__ == "__main__":  # debug rápido
     ext = np.array([0.92, 0.15, 0.60, 0.88, 0.05])
     intent = ext.copy()
-    psi = CoherenceEngine.calculate_psi_index(intent, ext)
+    psi = calculate_psi_index(intent, ext)
     print(f"Ψ(ext, ext) = {psi:.4f}")
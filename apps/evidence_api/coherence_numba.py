@@ -0,0 +1,75 @@
+"""Kernel Numba (opcional) para o cálculo de Ψ.
+
+Funde as reduções ``<a, a>``, ``<b, b>`` e ``<a, b>`` num único laço e
+combina o resultado em Ψ sem passar pelo interpretador. Se o Numba não
+estiver instalado, ``NUMBA_AVAILABLE`` é ``False`` e ``psi_kernel`` é
+``None``; o ``CoherenceEngine`` então usa o caminho NumPy.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Optional
+
+import numpy as np
+
+try:  # dependência opcional
+    from numba import njit
+except ImportError:  # pragma: no cover - depende do ambiente
+    njit = None
+
+NUMBA_AVAILABLE: bool = njit is not None
+
+psi_kernel: Optional[Callable[[np.ndarray, np.ndarray, float], float]] = None
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True)
+    def _psi_kernel(a, b, lam):  # pragma: no cover - compilado pelo Numba
+        n = a.shape[0]
+        aa = 0.0
+        bb = 0.0
+        ab = 0.0
+        sa = 0.0
+        sb = 0.0
+        for i in range(n):
+            # Acumula em float64 mesmo com entradas float32
+            x = np.float64(a[i])
+            y = np.float64(b[i])
+            aa += x * x
+            bb += y * y
+            ab += x * y
+            sa += x
+            sb += y
+
+        # Vetor nulo: mesma convenção de ``coherence_engine.normalize``
+        # (vira o vetor uniforme 1/sqrt(n)).
+        inv_sqrt_n = 1.0 / math.sqrt(n)
+        if aa == 0.0 and bb == 0.0:
+            aa = 1.0
+            bb = 1.0
+            ab = 1.0
+        elif aa == 0.0:
+            aa = 1.0
+            ab = sb * inv_sqrt_n
+        elif bb == 0.0:
+            bb = 1.0
+            ab = sa * inv_sqrt_n
+
+        cos = ab / math.sqrt(aa * bb)
+        distance = math.sqrt(max(0.0, 2.0 - 2.0 * cos))
+
+        fidelity = min(max(cos, 0.0), 1.0)
+        penalty = -math.expm1(-0.5 * distance)
+
+        psi = fidelity - lam * penalty
+        return psi if psi > 0.0 else 0.0
+
+    # Aquecimento do JIT no import: a primeira requisição não paga a compilação.
+    # float64, o dtype que ``calculate_psi_index`` entrega ao kernel.
+    _dummy = np.ones(5, dtype=np.float64)
+    _psi_kernel(_dummy, _dummy, 0.27)
+    del _dummy
+
+    psi_kernel = _psi_kernel
@@ -13,18 +13,24 @@ que recebe uma intenção (texto + vetor) e devolve uma Evidence Note com:
 
 from __future__ import annotations
 
+import base64
+import binascii
 import hashlib
 import time
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 from .coherence_engine import (
-    CoherenceEngine,
     LAMBDA_SOVEREIGN,
     PSI_ETHICAL_THRESHOLD,
+    calculate_psi_batch,
+    calculate_psi_index,
+    get_coherence_status,
+    normalize,
 )
 
 
@@ -43,23 +49,79 @@ app = FastAPI(
 # -----------------
 
 
+def _check_vector(arr: np.ndarray, field: str) -> np.ndarray:
+    """Valida um vetor já convertido: unidimensional e só com números finitos."""
+    if arr.ndim != 1:
+        raise ValueError(f"{field} deve ser um vetor unidimensional.")
+    # ``null`` vira NaN em ``np.asarray``; rejeita como o ``List[float]`` fazia
+    if not np.isfinite(arr).all():
+        raise ValueError(f"{field} deve conter apenas números finitos.")
+    return arr
+
+
 class EvidenceRequest(BaseModel):
     """Payload básico de uma intenção a ser avaliada.
 
     *intent*: texto livre (para logging futuro / embeddings reais).
     *intent_vector*: vetor numérico representando ρ_int.
+    *intent_vector_b64*: alternativa binária a *intent_vector* – os bytes do
+    vetor em float32 little-endian, codificados em base64. Evita o parse de
+    uma lista JSON número a número.
     """
 
     intent: str = Field(..., min_length=1, description="Texto bruto da intenção")
-    intent_vector: List[float] = Field(
-        ...,
+    intent_vector: Any = Field(
+        None,
         description="Vetor numérico representando o estado semântico da intenção.",
+        json_schema_extra={"type": "array", "items": {"type": "number"}},
+    )
+    intent_vector_b64: Optional[str] = Field(
+        None,
+        description="intent_vector como float32 little-endian em base64.",
     )
     metadata: Dict[str, Any] = Field(
         default_factory=dict,
         description="Metadados opcionais (origem, tags, etc.)",
     )
 
+    @field_validator("intent_vector", mode="before")
+    @classmethod
+    def _as_float_array(cls, value: Any) -> Optional[np.ndarray]:
+        if value is None:
+            return None
+        # Uma única cópia tipada em C, em vez de validar float a float em Python.
+        # float64 aqui: o vetor só vira float32 depois de normalizado, então
+        # valores fora da faixa do float32 continuam válidos.
+        try:
+            arr = np.asarray(value, dtype=np.float64)
+        except (TypeError, ValueError, OverflowError) as exc:
+            raise ValueError("intent_vector deve ser uma lista de números.") from exc
+        return _check_vector(arr, "intent_vector")
+
+    @model_validator(mode="after")
+    def _decode_intent_vector_b64(self) -> "EvidenceRequest":
+        if self.intent_vector_b64 is None:
+            if self.intent_vector is None:
+                raise ValueError("Informe intent_vector ou intent_vector_b64.")
+            return self
+        if self.intent_vector is not None:
+            raise ValueError(
+                "Informe apenas um entre intent_vector e intent_vector_b64."
+            )
+
+        try:
+            raw = base64.b64decode(self.intent_vector_b64, validate=True)
+            arr = np.frombuffer(raw, dtype="<f4")
+        except (binascii.Error, ValueError) as exc:
+            raise ValueError(
+                "intent_vector_b64 deve conter float32 little-endian em base64."
+            ) from exc
+        # Mesmo dtype e mesmas regras de ``intent_vector`` (float64 nativo)
+        self.intent_vector = _check_vector(
+            arr.astype(np.float64), "intent_vector_b64"
+        )
+        return self
+
 
 class EvidenceNote(BaseModel):
     """Registro mínimo de uma Evidence Note."""
@@ -77,9 +139,11 @@ class EvidenceNote(BaseModel):
 # -----------------
 
 # Vetor de referência externo (ρ_ext). Em produção, isso deve ser derivado
-# de embeddings dos seus DOCX / corpus. Aqui deixamos um seed estável.
-_EXTERNAL_COHERENCE_VECTOR = np.array([0.92, 0.15, 0.60, 0.88, 0.05], dtype=float)
-_EXTERNAL_COHERENCE_VECTOR /= np.linalg.norm(_EXTERNAL_COHERENCE_VECTOR)
+# de embeddings dos seus DOCX / corpus. Aqui deixamos um seed estável, já
+# unitário e em float64 (o dtype dos kernels de Ψ: nenhuma cópia por chamada).
+_EXTERNAL_COHERENCE_VECTOR = normalize(
+    [0.92, 0.15, 0.60, 0.88, 0.05]
+).astype(np.float64)
 _VECTOR_DIMENSION = int(_EXTERNAL_COHERENCE_VECTOR.size)
 
 
@@ -105,36 +169,101 @@ async def health() -> Dict[str, str]:
 
 
 @app.post("/evidence", response_model=EvidenceNote)
-async def create_evidence(request: EvidenceRequest) -> EvidenceNote:
+def create_evidence(request: EvidenceRequest) -> EvidenceNote:
     """Cria uma Evidence Note com Ψ calculado via M-CSQI.
 
     Valida o tamanho do vetor, calcula Ψ e gera um hash estável do evento.
     """
 
-    if len(request.intent_vector) != _VECTOR_DIMENSION:
-        raise HTTPException(
-            status_code=400,
-            detail=(
-                f"Dimensão inválida para intent_vector. "
-                f"Esperado: `{_VECTOR_DIMENSION}`, recebido: `{len(request.intent_vector)}`."
-            ),
-        )
+    _check_dimension(request)
+
+    try:
+        psi_value = _cached_psi(request.intent_vector.tobytes())
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return _build_evidence_note(request, psi_value, time.time())
+
+
+@app.post("/evidence/batch", response_model=List[EvidenceNote])
+def create_evidence_batch(
+    requests: List[EvidenceRequest],
+    quantized: bool = False,
+) -> List[EvidenceNote]:
+    """Cria várias Evidence Notes de uma vez.
+
+    Todos os ρ_int são empilhados numa matriz e Ψ é calculado em bloco
+    contra o mesmo ρ_ext, em vez de uma chamada ao motor por intenção.
+    Com ``?quantized=true`` o cosseno é calculado sobre vetores int8.
+    """
 
-    rho_int = np.asarray(request.intent_vector, dtype=float)
+    if not requests:
+        return []
+
+    for index, request in enumerate(requests):
+        _check_dimension(request, index)
+
+    intent_matrix = np.stack([request.intent_vector for request in requests])
 
     try:
-        psi_value = CoherenceEngine.calculate_psi_index(
-            rho_int,
+        psi_values = calculate_psi_batch(
+            intent_matrix,
             _EXTERNAL_COHERENCE_VECTOR,
             lambda_sovereign=LAMBDA_SOVEREIGN,
+            quantized=quantized,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    status = CoherenceEngine.get_coherence_status(psi_value, PSI_ETHICAL_THRESHOLD)
 
     now = time.time()
-    raw = f"{request.intent}|{request.metadata}|{psi_value:.6f}|{now:.6f}"
-    hash_value = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return [
+        _build_evidence_note(request, float(psi_value), now)
+        for request, psi_value in zip(requests, psi_values)
+    ]
+
+
+def _check_dimension(request: EvidenceRequest, index: Optional[int] = None) -> None:
+    """HTTP 400 se ``intent_vector`` não tiver a dimensão de ρ_ext."""
+    size = request.intent_vector.size
+    if size != _VECTOR_DIMENSION:
+        where = "" if index is None else f" no item {index}"
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"Dimensão inválida para intent_vector{where}. "
+                f"Esperado: `{_VECTOR_DIMENSION}`, recebido: `{size}`."
+            ),
+        )
+
+
+@lru_cache(maxsize=4096)
+def _cached_psi(vector_bytes: bytes) -> float:
+    """Ψ de um ρ_int (bytes float64) contra o ρ_ext fixo do serviço.
+
+    Ψ depende só do vetor (ρ_ext e λ são constantes do módulo), então replays
+    do mesmo vetor (retries, idempotência) viram uma consulta ao cache. A
+    chave são os próprios bytes do vetor: sem risco de colisão.
+    """
+    # ρ_int bruto, em float64: o kernel tira as normas da mesma passada do
+    # produto interno, sem ``normalize``
+    rho_int = np.frombuffer(vector_bytes, dtype=np.float64)
+    return calculate_psi_index(
+        rho_int,
+        _EXTERNAL_COHERENCE_VECTOR,
+        lambda_sovereign=LAMBDA_SOVEREIGN,
+    )
+
+
+def _build_evidence_note(
+    request: EvidenceRequest, psi_value: float, now: float
+) -> EvidenceNote:
+    """Monta a Evidence Note (status do Ω-GATE + hash do evento)."""
+    status = get_coherence_status(psi_value, PSI_ETHICAL_THRESHOLD)
+
+    # Hash em streaming: sem montar (e copiar) o payload inteiro numa string
+    hasher = hashlib.sha256(request.intent.encode("utf-8"))
+    hasher.update(f"|{request.metadata}|{psi_value:.6f}|{now:.6f}".encode("utf-8"))
+    hash_value = hasher.hexdigest()
 
     return EvidenceNote(
         timestamp=now,
@@ -0,0 +1,39 @@
+"""Build do kernel Cython opcional (``apps/evidence_api/_psi_kernel.pyx``).
+
+``pip install .`` compila a extensão: o ``pyproject.toml`` declara o Cython
+como dependência de build. Para usar direto do checkout::
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+Sem a extensão compilada (por exemplo, ``setup.py`` rodando fora do build
+isolado e sem Cython), o ``CoherenceEngine`` usa o kernel Numba (se
+disponível) ou o caminho NumPy.
+"""
+
+from setuptools import Extension, setup
+
+try:  # dependência opcional de build
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+ext_modules = []
+if cythonize is not None:
+    ext_modules = cythonize(
+        [
+            Extension(
+                "apps.evidence_api._psi_kernel",
+                ["apps/evidence_api/_psi_kernel.pyx"],
+                extra_compile_args=["-O3"],
+            )
+        ],
+        language_level=3,
+    )
+
+setup(
+    name="matverse-core",
+    version="0.1.0",
+    packages=["apps", "apps.evidence_api"],
+    ext_modules=ext_modules,
+)
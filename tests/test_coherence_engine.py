@@ -10,7 +10,22 @@ Garantem que:
 import numpy as np
 import pytest
 
-from apps.evidence_api.coherence_engine import CoherenceEngine, LAMBDA_SOVEREIGN
+from apps.evidence_api.coherence_engine import (
+    LAMBDA_SOVEREIGN,
+    CoherenceEngine,
+    calculate_psi_index,
+    normalize,
+)
+
+# Mesmo seed de ρ_ext do serviço e uma intenção próxima dele
+EXTERNAL_VECTOR = np.array([0.92, 0.15, 0.60, 0.88, 0.05])
+INTENT_VECTOR = np.array([0.90, 0.10, 0.55, 0.80, 0.02])
+
+
+def _expected_psi(intent: np.ndarray, ext: np.ndarray) -> float:
+    fidelity = CoherenceEngine.uhlmann_fidelity(intent, ext)
+    penalty = CoherenceEngine.relative_entropy(intent, ext)
+    return max(0.0, fidelity - LAMBDA_SOVEREIGN * penalty)
 
 
 def test_psi_range_between_zero_and_one() -> None:
@@ -55,3 +70,146 @@ def test_empty_vectors_raise_value_error() -> None:
 
     with pytest.raises(ValueError, match="não podem ser vazios"):
         CoherenceEngine.calculate_psi_index(intent, ext, LAMBDA_SOVEREIGN)
+
+
+def test_fused_path_matches_individual_helpers() -> None:
+    ext = EXTERNAL_VECTOR
+    intent = INTENT_VECTOR
+
+    expected = _expected_psi(intent, ext)
+
+    psi = CoherenceEngine.calculate_psi_index(intent, ext, LAMBDA_SOVEREIGN)
+
+    assert psi == pytest.approx(expected, abs=1e-6)
+
+
+def test_assume_normalized_matches_default_path() -> None:
+    ext = EXTERNAL_VECTOR
+    intent = INTENT_VECTOR
+    ext_unit = ext / np.sqrt(np.dot(ext, ext))
+    intent_unit = intent / np.sqrt(np.dot(intent, intent))
+
+    psi = CoherenceEngine.calculate_psi_index(intent, ext, LAMBDA_SOVEREIGN)
+    psi_unit = CoherenceEngine.calculate_psi_index(
+        intent_unit, ext_unit, LAMBDA_SOVEREIGN, assume_normalized=True
+    )
+
+    assert psi_unit == pytest.approx(psi, abs=1e-6)
+
+
+def test_numba_kernel_matches_numpy_path() -> None:
+    pytest.importorskip("numba")
+    from apps.evidence_api.coherence_numba import psi_kernel
+
+    ext = EXTERNAL_VECTOR
+    for intent in (INTENT_VECTOR, np.zeros(5)):
+        expected = _expected_psi(intent, ext)
+
+        assert psi_kernel(intent, ext, LAMBDA_SOVEREIGN) == pytest.approx(expected)
+
+
+def test_batch_matches_single_vector_path() -> None:
+    ext = EXTERNAL_VECTOR
+    intents = np.array(
+        [
+            INTENT_VECTOR,
+            [1.0, 0.0, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0, 0.0],
+        ]
+    )
+
+    psi_batch = CoherenceEngine.calculate_psi_batch(intents, ext, LAMBDA_SOVEREIGN)
+    expected = [
+        CoherenceEngine.calculate_psi_index(intent, ext, LAMBDA_SOVEREIGN)
+        for intent in intents
+    ]
+
+    assert psi_batch == pytest.approx(expected, abs=1e-6)
+
+    psi_int8 = CoherenceEngine.calculate_psi_batch(
+        intents, ext, LAMBDA_SOVEREIGN, quantized=True
+    )
+    assert psi_int8 == pytest.approx(expected, abs=2e-2)
+
+
+def test_cython_kernel_matches_numpy_path() -> None:
+    kernel = pytest.importorskip("apps.evidence_api._psi_kernel")
+
+    ext5 = EXTERNAL_VECTOR
+    cases = [
+        (INTENT_VECTOR, ext5),
+        (np.zeros(5), ext5),
+        (np.array([0.5, 0.5, 0.0]), np.array([1.0, 0.0, 0.0])),
+    ]
+    for intent, ext in cases:
+        expected = _expected_psi(intent, ext)
+
+        assert kernel.psi(intent, ext, LAMBDA_SOVEREIGN) == pytest.approx(expected)
+
+
+def test_module_function_matches_facade() -> None:
+    ext = EXTERNAL_VECTOR
+    intent = INTENT_VECTOR
+
+    assert calculate_psi_index(intent, ext) == CoherenceEngine.calculate_psi_index(
+        intent, ext
+    )
+
+
+def test_cython_kernel_unrolled_path_matches_generic_loop() -> None:
+    kernel = pytest.importorskip("apps.evidence_api._psi_kernel")
+
+    ext5 = EXTERNAL_VECTOR
+    ext6 = np.append(ext5, 0.0)
+
+    psi5 = kernel.psi(ext5 * 1e-150, ext5, LAMBDA_SOVEREIGN)
+    psi6 = kernel.psi(ext6 * 1e-150, ext6, LAMBDA_SOVEREIGN)
+
+    assert psi5 == pytest.approx(psi6)
+    assert psi5 == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("scale", [1e-25, 1e39])
+def test_psi_is_scale_invariant(scale: float) -> None:
+    ext = EXTERNAL_VECTOR
+    intent = INTENT_VECTOR
+
+    psi = CoherenceEngine.calculate_psi_index(intent * scale, ext, LAMBDA_SOVEREIGN)
+
+    assert psi == pytest.approx(CoherenceEngine.calculate_psi_index(intent, ext))
+
+
+def test_unit_path_accepts_strided_and_mixed_dtype_vectors() -> None:
+    ext = EXTERNAL_VECTOR
+    intent = INTENT_VECTOR
+    columns = np.stack([intent / np.linalg.norm(intent), ext / np.linalg.norm(ext)], 1)
+
+    psi = CoherenceEngine.calculate_psi_index(
+        columns[:, 0], columns[:, 1], LAMBDA_SOVEREIGN, assume_normalized=True
+    )
+    fidelity = CoherenceEngine.uhlmann_fidelity_unit(
+        columns[:, 0].copy(), columns[:, 1].astype(np.float32)
+    )
+
+    assert psi == pytest.approx(CoherenceEngine.calculate_psi_index(intent, ext))
+    assert fidelity == pytest.approx(CoherenceEngine.uhlmann_fidelity(intent, ext))
+
+
+def test_normalize_matrix_rows() -> None:
+    matrix = np.array(
+        [
+            INTENT_VECTOR,
+            [0.0, 0.0, 0.0, 0.0, 0.0],
+            [3.0, 4.0, 0.0, 0.0, 0.0],
+        ]
+    )
+
+    rows = normalize(matrix)
+
+    assert rows.dtype == np.float32
+    assert rows.flags.c_contiguous
+    assert np.linalg.norm(rows, axis=1) == pytest.approx([1.0, 1.0, 1.0])
+    # Linha nula vira o vetor uniforme, como no caso 1-D
+    assert rows[1] == pytest.approx(np.full(5, 1.0 / np.sqrt(5)))
+    assert rows[2] == pytest.approx([0.6, 0.8, 0.0, 0.0, 0.0])
+    assert normalize(np.empty((3, 0))).shape == (3, 0)
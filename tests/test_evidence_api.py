@@ -0,0 +1,165 @@
+"""Testes da Evidence API (FastAPI) via ``TestClient``.
+
+Garantem que:
+- ``/evidence`` calcula Ψ de forma invariante à escala do vetor;
+- payloads inválidos são rejeitados com 400/422;
+- ``/evidence/batch`` devolve o mesmo Ψ que ``/evidence`` para cada item;
+- ``intent_vector_b64`` (float32 little-endian) equivale a ``intent_vector``;
+- replays do mesmo vetor saem do cache e o hash do evento é estável.
+"""
+
+import base64
+import hashlib
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from apps.evidence_api import main
+from apps.evidence_api.main import app
+
+client = TestClient(app)
+
+INTENT_VECTOR = [0.90, 0.10, 0.55, 0.80, 0.02]
+
+
+def _post_evidence(**fields):
+    return client.post("/evidence", json={"intent": "teste", **fields})
+
+
+@pytest.mark.parametrize("scale", [1e-25, 1e39])
+def test_evidence_psi_is_scale_invariant(scale: float) -> None:
+    scaled = [x * scale for x in INTENT_VECTOR]
+
+    psi = _post_evidence(intent_vector=INTENT_VECTOR).json()["psi_index"]
+    psi_scaled = _post_evidence(intent_vector=scaled).json()["psi_index"]
+
+    assert psi_scaled == pytest.approx(psi)
+
+
+def test_evidence_returns_psi_for_valid_vector() -> None:
+    response = _post_evidence(intent_vector=INTENT_VECTOR)
+
+    assert response.status_code == 200
+    assert 0.0 <= response.json()["psi_index"] <= 1.0
+
+
+@pytest.mark.parametrize(
+    "vector",
+    [
+        [1, None, 3, 4, 5],
+        "abc",
+        [[1, 2, 3, 4, 5]],
+        {"a": 1},
+        [1, "x", 3, 4, 5],
+        [10**400, 0, 0, 0, 0],  # inteiro JSON fora da faixa do float64
+    ],
+)
+def test_evidence_rejects_invalid_vectors_with_422(vector) -> None:
+    response = _post_evidence(intent_vector=vector)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("vector", [[1.0, 2.0], []])
+def test_evidence_rejects_wrong_dimension_with_400(vector) -> None:
+    response = _post_evidence(intent_vector=vector)
+
+    assert response.status_code == 400
+    assert "Dimensão inválida" in response.json()["detail"]
+
+
+def _post_batch(vectors, **params):
+    payload = [
+        {"intent": f"teste {i}", "intent_vector": v} for i, v in enumerate(vectors)
+    ]
+    return client.post("/evidence/batch", json=payload, params=params)
+
+
+def test_batch_matches_single_evidence() -> None:
+    vectors = [INTENT_VECTOR, [1.0, 0.0, 0.0, 0.0, 0.0], [0.0] * 5]
+    expected = [_post_evidence(intent_vector=v).json()["psi_index"] for v in vectors]
+
+    notes = _post_batch(vectors).json()
+
+    assert [n["psi_index"] for n in notes] == pytest.approx(expected, abs=1e-6)
+
+
+def test_batch_quantized_is_close_to_exact() -> None:
+    vectors = [INTENT_VECTOR, [1.0, 0.0, 0.0, 0.0, 0.0]]
+    exact = [n["psi_index"] for n in _post_batch(vectors).json()]
+
+    quantized = [n["psi_index"] for n in _post_batch(vectors, quantized=True).json()]
+
+    assert quantized == pytest.approx(exact, abs=2e-2)
+
+
+def test_batch_empty_list_returns_empty_list() -> None:
+    response = client.post("/evidence/batch", json=[])
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_batch_reports_item_with_wrong_dimension() -> None:
+    response = _post_batch([INTENT_VECTOR, [1.0, 2.0]])
+
+    assert response.status_code == 400
+    assert "no item 1" in response.json()["detail"]
+
+
+def _b64(vector) -> str:
+    return base64.b64encode(np.asarray(vector, dtype="<f4").tobytes()).decode()
+
+
+def test_b64_vector_matches_list_vector() -> None:
+    psi = _post_evidence(intent_vector=INTENT_VECTOR).json()["psi_index"]
+
+    psi_b64 = _post_evidence(intent_vector_b64=_b64(INTENT_VECTOR)).json()["psi_index"]
+
+    assert psi_b64 == pytest.approx(psi, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {},
+        {"intent_vector": INTENT_VECTOR, "intent_vector_b64": _b64(INTENT_VECTOR)},
+        {"intent_vector_b64": "AAAAAA="},  # padding inválido
+        {"intent_vector_b64": "AAAAAAA="},  # 5 bytes: não é múltiplo de 4
+        {"intent_vector_b64": _b64([np.nan, 0.0, 0.0, 0.0, 0.0])},
+        {"intent_vector_b64": _b64([np.inf, 0.0, 0.0, 0.0, 0.0])},
+    ],
+)
+def test_b64_payload_errors_return_422(fields) -> None:
+    response = _post_evidence(**fields)
+
+    assert response.status_code == 422
+
+
+def test_b64_wrong_dimension_returns_400() -> None:
+    response = _post_evidence(intent_vector_b64=_b64([1.0, 2.0]))
+
+    assert response.status_code == 400
+
+
+def test_replayed_vector_hits_psi_cache() -> None:
+    main._cached_psi.cache_clear()
+
+    first = _post_evidence(intent_vector=INTENT_VECTOR).json()
+    replay = _post_evidence(intent_vector=INTENT_VECTOR).json()
+
+    assert replay["psi_index"] == first["psi_index"]
+    assert main._cached_psi.cache_info().hits == 1
+
+
+def test_evidence_hash_is_stable_for_same_event(monkeypatch) -> None:
+    monkeypatch.setattr(main.time, "time", lambda: 1732526400.123)
+
+    first = _post_evidence(intent_vector=INTENT_VECTOR, metadata={"source": "t"})
+    second = _post_evidence(intent_vector=INTENT_VECTOR, metadata={"source": "t"})
+
+    note = first.json()
+    raw = f"teste|{{'source': 't'}}|{note['psi_index']:.6f}|{note['timestamp']:.6f}"
+    assert note["hash_sha256"] == hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    assert second.json()["hash_sha256"] == note["hash_sha256"]